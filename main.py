@@ -6,22 +6,80 @@ Downloads PDF documents from https://imagem.camara.leg.br/pesquisa_diario_basica
 
 import os
 import re
-import json
 import time
+import shutil
+import socket
 import logging
+import threading
+import orjson
 import requests
+from collections import Counter
 from datetime import datetime, timedelta
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from urllib.parse import urljoin, urlparse
 from pathlib import Path
-from typing import List, Dict, Tuple, Optional
+from typing import Any, BinaryIO, List, Dict, Set, Tuple, Optional
 from dataclasses import dataclass
 from requests.adapters import HTTPAdapter
+from urllib3.util.connection import allowed_gai_family
 from urllib3.util.retry import Retry
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from tqdm import tqdm
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None  # type: ignore[assignment]
+
+
+_YEAR_RE = re.compile(rb'\b(?:19|20)\d{2}\b')
+_DATE_RE = re.compile(r'Datain=(\d+/\d+/\d+)')
+_PDF_RE = re.compile(r'(?:https://imagem\.camara\.gov\.br)?/Imagem/d/pdf/[^"]+\.PDF', re.IGNORECASE)
+_CONTENT_RANGE_RE = re.compile(r'bytes (\d+)-')
+_PDF_LINK_RE = re.compile(r'href=["\']([^"\']+\.pdf)["\']', re.IGNORECASE)
+
+_MONTH_NAMES = ('Janeiro', 'Fevereiro', 'Março', 'Abril', 'Maio', 'Junho',
+                'Julho', 'Agosto', 'Setembro', 'Outubro', 'Novembro', 'Dezembro')
+
+_WEEKDAY_LINKS = SoupStrainer('a', class_='WeekDay')
+
+# DNS results for pinned hosts, resolved once per process
+_PINNED_HOSTS: Set[str] = set()
+_DNS_CACHE: Dict[tuple, list] = {}
+_system_getaddrinfo = socket.getaddrinfo
+
+
+def _pinned_getaddrinfo(host, port, *args, **kwargs):
+    """socket.getaddrinfo that resolves each pinned host only once"""
+    if host not in _PINNED_HOSTS:
+        return _system_getaddrinfo(host, port, *args, **kwargs)
+    key = (host, port, args, tuple(sorted(kwargs.items())))
+    addrs = _DNS_CACHE.get(key)
+    if addrs is None:
+        addrs = _system_getaddrinfo(host, port, *args, **kwargs)
+        _DNS_CACHE[key] = addrs
+    return addrs
+
+
+def pin_dns(hosts: List[str], port: int = 443):
+    """Resolve hosts up front and serve later lookups for them from the cache"""
+    _PINNED_HOSTS.update(hosts)
+    socket.getaddrinfo = _pinned_getaddrinfo
+    for host in hosts:
+        try:
+            # Same arguments urllib3 uses when opening a connection
+            socket.getaddrinfo(host, port, allowed_gai_family(), socket.SOCK_STREAM)
+        except socket.gaierror as e:
+            logging.warning(f"Failed to pre-resolve {host}: {e}")
+
+
+def unpin_dns():
+    """Restore the system resolver and forget pinned hosts"""
+    socket.getaddrinfo = _system_getaddrinfo
+    _PINNED_HOSTS.clear()
+    _DNS_CACHE.clear()
+
 
 @dataclass
 class Config:
@@ -30,65 +88,133 @@ class Config:
     end_year: int = 2005
     max_threads: int = 40
     base_url: str = 'https://imagem.camara.leg.br/'
+    pdf_base_url: str = 'https://imagem.camara.gov.br'    # Host serving the PDFs, no trailing slash
     download_dir: str = './downloads'
     retry_attempts: int = 3
     retry_delay: float = 1.0
     request_timeout: int = 15
     rate_limit_delay: float = 0.02
+    log_interval: int = 100             # Log progress every N processed dates
+    write_buffer_size: int = 1 << 20    # Also the copy block size for PDF downloads
     user_agent: str = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
 
 
+class RateLimiter:
+    """Spaces out requests across all worker threads"""
+    
+    def __init__(self, delay: float):
+        self.delay = delay
+        self._lock = threading.Lock()
+        self._next_slot = time.monotonic()
+    
+    def wait(self):
+        """Block until the calling thread may send its next request"""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.delay
+        if slot > now:
+            time.sleep(slot - now)
+
+
 class ProgressTracker:
-    """Tracks download progress and saves state"""
+    """Tracks download progress and saves state; safe to update from worker threads"""
     
     def __init__(self, progress_file: str = 'download_progress.json'):
         self.progress_file = progress_file
+        # Append-only journal of completed dates, folded into progress_file on save
+        self.journal_file = os.path.splitext(progress_file)[0] + '.log'
+        self._journal: Optional[BinaryIO] = None
+        self._lock = threading.Lock()
         self.data = self.load_progress()
         
     def load_progress(self) -> Dict:
-        """Load existing progress from file"""
+        """Load existing progress from file and replay the journal"""
+        data: Dict[str, Any] = {'completed_dates': [], 'failed_downloads': [], 'stats': {}}
         if os.path.exists(self.progress_file):
             try:
-                with open(self.progress_file, 'r') as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, IOError):
+                with open(self.progress_file, 'rb') as f:
+                    data = orjson.loads(f.read())
+            except (orjson.JSONDecodeError, IOError):
                 pass
-        return {'completed_dates': [], 'failed_downloads': [], 'stats': {}}
+        # Keep completed dates in a set for O(1) membership checks
+        data['completed_dates'] = set(data.get('completed_dates', []))
+        data.setdefault('failed_downloads', [])
+        data['stats'] = Counter(data.get('stats', {}))
+        if os.path.exists(self.journal_file):
+            try:
+                with open(self.journal_file, 'rb') as f:
+                    for line in f:
+                        try:
+                            data['completed_dates'].add(orjson.loads(line)['done'])
+                        except (orjson.JSONDecodeError, KeyError, TypeError):
+                            # Torn last line from an interrupted write
+                            continue
+            except IOError:
+                pass
+        return data
     
     def save_progress(self):
-        """Save current progress to file"""
-        try:
-            with open(self.progress_file, 'w') as f:
-                json.dump(self.data, f, indent=2)
-        except IOError as e:
-            logging.error(f"Failed to save progress: {e}")
+        """Save current progress to file and compact the journal"""
+        with self._lock:
+            try:
+                tmp_file = self.progress_file + '.tmp'
+                with open(tmp_file, 'wb') as f:
+                    f.write(orjson.dumps(self._serializable_data(), option=orjson.OPT_SORT_KEYS))
+                os.replace(tmp_file, self.progress_file)
+                
+                # Everything in the journal is now in progress_file
+                self._close_journal()
+                open(self.journal_file, 'w').close()
+            except IOError as e:
+                logging.error(f"Failed to save progress: {e}")
+    
+    def _serializable_data(self) -> Dict:
+        """Progress data with completed dates as a sorted list"""
+        return {**self.data, 'completed_dates': sorted(self.data['completed_dates'])}
+    
+    def close(self):
+        """Close the journal file"""
+        with self._lock:
+            self._close_journal()
+    
+    def _close_journal(self):
+        """Close the journal file; caller must hold the lock"""
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
     
     def is_date_completed(self, date_key: str) -> bool:
         """Check if a date has been completed"""
-        return date_key in self.data.get('completed_dates', [])
+        return date_key in self.data['completed_dates']
     
     def mark_date_completed(self, date_key: str):
-        """Mark a date as completed"""
-        if 'completed_dates' not in self.data:
-            self.data['completed_dates'] = []
-        if date_key not in self.data['completed_dates']:
-            self.data['completed_dates'].append(date_key)
+        """Mark a date as completed and journal it durably"""
+        with self._lock:
+            self.data['completed_dates'].add(date_key)
+            try:
+                if self._journal is None:
+                    self._journal = open(self.journal_file, 'ab')
+                self._journal.write(orjson.dumps({'done': date_key}) + b'\n')
+                self._journal.flush()
+                os.fsync(self._journal.fileno())
+            except IOError as e:
+                logging.error(f"Failed to journal progress: {e}")
     
     def add_failed_download(self, url: str, error: str):
         """Add a failed download"""
-        if 'failed_downloads' not in self.data:
-            self.data['failed_downloads'] = []
-        self.data['failed_downloads'].append({
+        failure = {
             'url': url,
             'error': error,
             'timestamp': datetime.now().isoformat()
-        })
+        }
+        with self._lock:
+            self.data['failed_downloads'].append(failure)
     
     def update_stats(self, key: str, value: int):
         """Update statistics"""
-        if 'stats' not in self.data:
-            self.data['stats'] = {}
-        self.data['stats'][key] = self.data['stats'].get(key, 0) + value
+        with self._lock:
+            self.data['stats'][key] += value
 
 
 class CamaraDownloader:
@@ -100,16 +226,28 @@ class CamaraDownloader:
         self.session.headers.update({'User-Agent': config.user_agent})
         
         # Configure connection pool with custom adapter
+        # Single retry policy for every request: exponential backoff, honouring Retry-After
+        retry = Retry(
+            total=config.retry_attempts,
+            backoff_factor=config.retry_delay,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=['GET', 'HEAD'],
+            respect_retry_after_header=True
+        )
         adapter = HTTPAdapter(
-            pool_connections=60,        # Number of connection pools (higher than threads)
-            pool_maxsize=75,           # Max connections per pool  
-            max_retries=3,             # Built-in retry logic
-            pool_block=False           # Don't block when pool is full
+            pool_connections=2,                 # One pool per host (.leg.br pages, .gov.br PDFs)
+            pool_maxsize=config.max_threads,    # One keep-alive connection per worker
+            max_retries=retry,
+            pool_block=True                     # Wait for a pooled connection instead of opening a throwaway one
         )
         self.session.mount('http://', adapter)
         self.session.mount('https://', adapter)
         
         self.progress = ProgressTracker()
+        self.rate_limiter = RateLimiter(config.rate_limit_delay)
+        
+        # Long-lived worker pool shared by all years
+        self.executor = ThreadPoolExecutor(max_workers=config.max_threads, thread_name_prefix='camara')
         
         # Setup logging
         logging.basicConfig(
@@ -124,15 +262,20 @@ class CamaraDownloader:
         
         # Create download directory
         Path(self.config.download_dir).mkdir(parents=True, exist_ok=True)
+        
+        # Directories already created by this run
+        self._created_dirs: Set[Path] = set()
+        
+        # .part files currently being written by a worker, with the owner's result
+        self._inflight: Dict[Path, Future] = {}
+        self._inflight_lock = threading.Lock()
     
     def log_failed_download_details(self, pdf_url: str, date_str: str, error: str):
         """Enhanced logging for failed downloads with detailed date extraction"""
         try:
             # Extract date parts from date_str (format: DD/MM/YYYY)
             day, month, year = date_str.split('/')
-            month_names = ['Janeiro', 'Fevereiro', 'Março', 'Abril', 'Maio', 'Junho',
-                          'Julho', 'Agosto', 'Setembro', 'Outubro', 'Novembro', 'Dezembro']
-            month_name = month_names[int(month) - 1]
+            month_name = _MONTH_NAMES[int(month) - 1]
             
             self.logger.error("=" * 80)
             self.logger.error(f"FAILED DOWNLOAD - MANUAL INTERVENTION REQUIRED")
@@ -148,6 +291,13 @@ class CamaraDownloader:
             self.logger.error(f"Raw date string: {date_str}")
             self.logger.error(f"Failed URL: {pdf_url}")
     
+    def warm_up_pdf_host(self):
+        """Open a keep-alive connection to the PDF host ahead of the first download"""
+        try:
+            self.session.head(self.config.pdf_base_url + '/', timeout=5)
+        except requests.RequestException as e:
+            self.logger.debug(f"PDF host warm-up failed: {e}")
+    
     def get_available_years(self) -> List[int]:
         """Extract available years from the main page"""
         try:
@@ -155,14 +305,11 @@ class CamaraDownloader:
             response = self.session.get(url, timeout=self.config.request_timeout)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
             # Find year options in the page
-            year_pattern = re.compile(r'\b(19|20)\d{2}\b')
             years = set()
             
-            # Look for year patterns in the HTML content
-            for match in year_pattern.finditer(response.text):
+            # Look for year patterns in the raw HTML content
+            for match in _YEAR_RE.finditer(response.content):
                 year = int(match.group())
                 if 1881 <= year <= datetime.now().year:
                     years.add(year)
@@ -184,15 +331,15 @@ class CamaraDownloader:
             response = self.session.get(url, timeout=self.config.request_timeout)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, 'lxml', parse_only=_WEEKDAY_LINKS)
             date_links = []
             
             # Find all links with the date pattern
-            for link in soup.find_all('a', class_='WeekDay'):
+            for link in soup.find_all('a'):
                 href = link.get('href', '')
                 if 'dc_20b.asp' in href and 'Datain=' in href:
                     # Extract date from href
-                    date_match = re.search(r'Datain=(\d+/\d+/\d+)', href)
+                    date_match = _DATE_RE.search(href)
                     if date_match:
                         date_str = date_match.group(1)
                         full_url = urljoin(self.config.base_url, href)
@@ -208,32 +355,25 @@ class CamaraDownloader:
     def resolve_pdf_url(self, date_url: str) -> Optional[str]:
         """Follow a date link to get the actual PDF URL"""
         try:
+            self.rate_limiter.wait()
             response = self.session.get(date_url, timeout=self.config.request_timeout)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Look for PDF links in the response
-            pdf_patterns = [
-                r'https://imagem\.camara\.gov\.br/Imagem/d/pdf/[^"]+\.PDF',
-                r'/Imagem/d/pdf/[^"]+\.PDF'
-            ]
-            
-            for pattern in pdf_patterns:
-                matches = re.findall(pattern, response.text, re.IGNORECASE)
-                if matches:
-                    pdf_url = matches[0]
-                    if not pdf_url.startswith('http'):
-                        pdf_url = 'https://imagem.camara.gov.br' + pdf_url
-                    return pdf_url
+            # Look for PDF links (absolute or relative) in the response
+            pdf_match = _PDF_RE.search(response.text)
+            if pdf_match:
+                pdf_url = pdf_match.group()
+                if not pdf_url.startswith('http'):
+                    pdf_url = self.config.pdf_base_url + pdf_url
+                return pdf_url
             
-            # Alternative: look for specific link elements
-            for link in soup.find_all('a'):
-                href = link.get('href', '')
-                if '.PDF' in href.upper():
-                    if not href.startswith('http'):
-                        href = 'https://imagem.camara.gov.br' + href
-                    return href
+            # Alternative: any link to a PDF file
+            link_match = _PDF_LINK_RE.search(response.text)
+            if link_match:
+                href = link_match.group(1)
+                if not href.startswith('http'):
+                    href = self.config.pdf_base_url + href
+                return href
                     
             return None
             
@@ -241,8 +381,8 @@ class CamaraDownloader:
             self.logger.error(f"Failed to resolve PDF URL from {date_url}: {e}")
             return None
     
-    def download_pdf(self, pdf_url: str, date_str: str, year: int) -> bool:
-        """Download a single PDF file"""
+    def download_pdf(self, pdf_url: str, date_str: str, year: int) -> Optional[bool]:
+        """Download a single PDF file; None if another process is downloading it"""
         try:
             # Create directory structure: year/month/day
             date_parts = date_str.split('/')
@@ -254,7 +394,9 @@ class CamaraDownloader:
                 day_padded = day.zfill(2)
                 
                 save_dir = Path(self.config.download_dir) / str(year) / month_padded / day_padded
-                save_dir.mkdir(parents=True, exist_ok=True)
+                if save_dir not in self._created_dirs:
+                    save_dir.mkdir(parents=True, exist_ok=True)
+                    self._created_dirs.add(save_dir)
                 
                 # Extract filename from URL
                 filename = os.path.basename(urlparse(pdf_url).path)
@@ -263,35 +405,34 @@ class CamaraDownloader:
                 
                 save_path = save_dir / filename
                 
-                # Skip if file already exists
-                if save_path.exists():
-                    self.logger.debug(f"File already exists: {save_path}")
-                    return True
+                # Download into a .part file that is renamed into place once complete.
+                # A second worker in this process for the same PDF waits for the owner's result.
+                part_path = save_path.with_suffix('.PDF.part')
+                with self._inflight_lock:
+                    owner = self._inflight.get(part_path)
+                    if owner is None:
+                        result_future: Future = Future()
+                        self._inflight[part_path] = result_future
+                if owner is not None:
+                    self.logger.debug(f"Waiting for another worker downloading {save_path}")
+                    return owner.result()
                 
-                # Download with retry logic
-                for attempt in range(self.config.retry_attempts):
-                    try:
-                        response = self.session.get(pdf_url, timeout=self.config.request_timeout, stream=True)
-                        response.raise_for_status()
-                        
-                        with open(save_path, 'wb') as f:
-                            for chunk in response.iter_content(chunk_size=65536):
-                                if chunk:
-                                    f.write(chunk)
-                        
-                        self.logger.info(f"Downloaded: {filename} -> {save_path}")
-                        self.progress.update_stats('downloads_completed', 1)
-                        return True
-                        
-                    except Exception as e:
-                        self.logger.warning(f"Download attempt {attempt + 1} failed for {pdf_url}: {e}")
-                        if attempt < self.config.retry_attempts - 1:
-                            time.sleep(self.config.retry_delay * (2 ** attempt))
-                        else:
-                            self.log_failed_download_details(pdf_url, date_str, str(e))
-                            self.progress.add_failed_download(pdf_url, str(e))
-                            self.progress.update_stats('downloads_failed', 1)
-                            return False
+                result: Optional[bool] = False
+                try:
+                    # Transient errors are retried by the adapter
+                    result = self._download_to_part(pdf_url, save_path, part_path)
+                    if result is None:
+                        self.logger.info(f"Skipping {save_path}, being downloaded by another process")
+                    return result
+                except Exception as e:
+                    self.log_failed_download_details(pdf_url, date_str, str(e))
+                    self.progress.add_failed_download(pdf_url, str(e))
+                    self.progress.update_stats('downloads_failed', 1)
+                    return False
+                finally:
+                    with self._inflight_lock:
+                        del self._inflight[part_path]
+                    result_future.set_result(result)
             
             return False
             
@@ -301,41 +442,133 @@ class CamaraDownloader:
             self.progress.update_stats('downloads_failed', 1)
             return False
     
-    def process_date_batch(self, date_batch: List[Tuple[str, str]], year: int) -> int:
-        """Process a batch of dates concurrently"""
-        successful_downloads = 0
+    def _download_to_part(self, pdf_url: str, save_path: Path, part_path: Path) -> Optional[bool]:
+        """Download into part_path under an exclusive lock and rename it to save_path.
         
-        with ThreadPoolExecutor(max_workers=self.config.max_threads) as executor:
-            # Submit all date processing tasks
-            future_to_date = {}
-            for date_str, date_url in date_batch:
-                date_key = f"{year}_{date_str}"
-                
-                if self.progress.is_date_completed(date_key):
-                    self.logger.debug(f"Skipping completed date: {date_str}")
-                    continue
+        Returns None if another process holds the .part file.
+        """
+        if save_path.exists():
+            self.logger.debug(f"File already exists: {save_path}")
+            return True
+        
+        # Open without truncating: a .part file nobody holds is left over from an
+        # interrupted run and is resumed
+        fd = os.open(part_path, os.O_RDWR | os.O_CREAT, 0o644)
+        claimed = renamed = False
+        try:
+            claimed = self._claim_part(fd, part_path)
+            if not claimed:
+                # The previous owner may have just finished it
+                return True if save_path.exists() else None
+            if save_path.exists():
+                return True
+            
+            existing = os.fstat(fd).st_size
+            headers = {'Range': f'bytes={existing}-'} if existing else {}
+            self.rate_limiter.wait()
+            response = self.session.get(pdf_url, headers=headers,
+                                        timeout=self.config.request_timeout, stream=True)
+            # Resume only if the server sent exactly the bytes we are missing
+            range_match = _CONTENT_RANGE_RE.match(response.headers.get('Content-Range', ''))
+            resumable = bool(existing and response.status_code == 206 and range_match
+                             and int(range_match.group(1)) == existing)
+            if response.status_code == 416 or (response.status_code == 206 and not resumable):
+                # Range not satisfiable or not the one requested, restart from scratch
+                response.close()
+                self.rate_limiter.wait()
+                response = self.session.get(pdf_url, timeout=self.config.request_timeout, stream=True)
+            
+            # Always release the pooled connection, even on an error status
+            with response:
+                response.raise_for_status()
                 
-                future = executor.submit(self._process_single_date, date_str, date_url, year)
-                future_to_date[future] = (date_str, date_key)
+                with os.fdopen(fd, 'wb', buffering=self.config.write_buffer_size, closefd=False) as f:
+                    # Append if the server honoured the Range request, otherwise start over
+                    if resumable:
+                        self.logger.debug(f"Resuming {save_path} from byte {existing}")
+                        f.seek(existing)
+                    else:
+                        f.truncate(0)
+                    
+                    # Copy the raw stream straight to disk in large blocks
+                    response.raw.decode_content = True
+                    shutil.copyfileobj(response.raw, f, length=self.config.write_buffer_size)
+            
+            # The PDF will not be read back, hint the kernel to drop it from the page
+            # cache; best effort, pages still waiting for writeback stay cached
+            if hasattr(os, 'posix_fadvise'):
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+            
+            # Rename while still holding the lock so no other process reopens the .part
+            os.rename(part_path, save_path)
+            renamed = True
+            
+            self.logger.info(f"Downloaded: {save_path.name} -> {save_path}")
+            self.progress.update_stats('downloads_completed', 1)
+            return True
+        finally:
+            # Don't leave empty .part files behind for requests that never got a body
+            if claimed and not renamed and os.fstat(fd).st_size == 0:
+                part_path.unlink(missing_ok=True)
+            os.close(fd)
+    
+    def _claim_part(self, fd: int, part_path: Path) -> bool:
+        """Take an exclusive, non-blocking lock on an open .part file"""
+        if fcntl is None:
+            # No cross-process claim on this platform, the in-process check still applies
+            return True
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            return False
+        # The previous owner may have renamed or removed the file after we opened it
+        try:
+            return os.fstat(fd).st_ino == os.stat(part_path).st_ino
+        except FileNotFoundError:
+            return False
+    
+    def process_year_dates(self, date_links: List[Tuple[str, str]], year: int) -> int:
+        """Process all dates of a year concurrently, keeping the worker pool saturated"""
+        successful_downloads = 0
+        processed = 0
+        
+        # Submit all date processing tasks up front so workers never idle
+        # waiting for the slowest date of a fixed-size batch
+        future_to_date = {}
+        for date_str, date_url in date_links:
+            date_key = f"{year}_{date_str}"
             
-            # Process completed futures
+            if self.progress.is_date_completed(date_key):
+                self.logger.debug(f"Skipping completed date: {date_str}")
+                continue
+            
+            future = self.executor.submit(self._process_single_date, date_str, date_url, year)
+            future_to_date[future] = (date_str, date_key)
+        
+        # Process completed futures
+        try:
             for future in as_completed(future_to_date):
                 date_str, date_key = future_to_date[future]
+                processed += 1
                 try:
                     success = future.result()
                     if success:
                         successful_downloads += 1
                         self.progress.mark_date_completed(date_key)
-                    
-                    # Add small delay between requests
-                    time.sleep(self.config.rate_limit_delay)
-                    
                 except Exception as e:
                     self.logger.error(f"Error processing date {date_str}: {e}")
+                
+                if processed % self.config.log_interval == 0:
+                    self.logger.info(f"Processed {processed}/{len(future_to_date)} dates for year {year}")
+        except BaseException:
+            # Interrupted (e.g. Ctrl-C): drop queued dates instead of downloading the rest of the year
+            for future in future_to_date:
+                future.cancel()
+            raise
         
         return successful_downloads
     
-    def _process_single_date(self, date_str: str, date_url: str, year: int) -> bool:
+    def _process_single_date(self, date_str: str, date_url: str, year: int) -> Optional[bool]:
         """Process a single date (resolve PDF URL and download)"""
         try:
             pdf_url = self.resolve_pdf_url(date_url)
@@ -348,46 +581,62 @@ class CamaraDownloader:
             self.logger.error(f"Error processing date {date_str}: {e}")
             return False
     
+    def close(self):
+        """Shut down the worker pool, the HTTP session, the progress journal and the DNS pin"""
+        self.executor.shutdown(wait=True, cancel_futures=True)
+        self.session.close()
+        self.progress.close()
+        unpin_dns()
+    
     def run(self):
         """Main execution method"""
         self.logger.info("Starting Brazilian Chamber of Deputies PDF scraper")
         
-        # Get available years
-        years = self.get_available_years()
-        if not years:
-            self.logger.error("No years found to process")
-            return
-        
-        total_downloads = 0
-        
-        # Process years from oldest to newest
-        for year in sorted(years):
-            self.logger.info(f"Processing year {year}")
+        try:
+            # Resolve the page and PDF hosts once instead of on every new connection
+            hosts = [urlparse(url).hostname for url in (self.config.base_url, self.config.pdf_base_url)]
+            pin_dns([host for host in hosts if host])
             
-            # Get all dates for this year
-            date_links = self.get_year_calendar(year)
-            if not date_links:
-                self.logger.warning(f"No dates found for year {year}")
-                continue
+            # Warm up the PDF host connection while the year list is fetched
+            self.executor.submit(self.warm_up_pdf_host)
+            
+            # Get available years
+            years = self.get_available_years()
+            if not years:
+                self.logger.error("No years found to process")
+                return
+            
+            total_downloads = 0
+            
+            # Fetch all year calendars concurrently
+            year_links = dict(zip(years, self.executor.map(self.get_year_calendar, years)))
             
-            # Process dates in batches
-            batch_size = 100  # Process 100 dates at a time (doubled for speed)
-            for i in range(0, len(date_links), batch_size):
-                batch = date_links[i:i + batch_size]
-                self.logger.info(f"Processing batch {i//batch_size + 1} for year {year} ({len(batch)} dates)")
+            # Process years from oldest to newest
+            for year in sorted(years):
+                self.logger.info(f"Processing year {year}")
                 
-                batch_downloads = self.process_date_batch(batch, year)
-                total_downloads += batch_downloads
+                # Get all dates for this year
+                date_links = year_links[year]
+                if not date_links:
+                    self.logger.warning(f"No dates found for year {year}")
+                    continue
+                
+                # Process all dates of the year through the worker pool
+                self.logger.info(f"Processing {len(date_links)} dates for year {year}")
+                year_downloads = self.process_year_dates(date_links, year)
+                total_downloads += year_downloads
                 
-                # Save progress after each batch
+                # Compact the progress journal after each year
                 self.progress.save_progress()
                 
-                self.logger.info(f"Batch completed. Downloaded {batch_downloads} files")
-        
-        # Final statistics
-        self.logger.info(f"Scraping completed! Total downloads: {total_downloads}")
-        self.logger.info(f"Failed downloads: {self.progress.data.get('stats', {}).get('downloads_failed', 0)}")
-        self.progress.save_progress()
+                self.logger.info(f"Year {year} completed. Downloaded {year_downloads} files")
+            
+            # Final statistics
+            self.logger.info(f"Scraping completed! Total downloads: {total_downloads}")
+            self.logger.info(f"Failed downloads: {self.progress.data.get('stats', {}).get('downloads_failed', 0)}")
+            self.progress.save_progress()
+        finally:
+            self.close()
 
 
 def main():